@@ -197,8 +197,8 @@ def generate_videos_from_subtopic_list_with_collection(
     from backend_pipeline.video_assembly.ffMpeg import (
         create_video_with_audio_and_captions,
     )
-    from save_to_db.save_video import add_video
-    
+    from save_to_db.save_video import add_videos_pipelined
+
     background_video_path = Path(background_video)
     output_dir = Path(output_dir)
     audio_dir = Path(audio_dir)
@@ -262,20 +262,23 @@ def generate_videos_from_subtopic_list_with_collection(
             "audio_file": audio_result["audio_file"],
         })
 
-    # Upload all videos to S3 and save to database with collection_id
+    # Upload all videos to S3 with the DB inserts pipelined behind them
     print(f"\n   ☁️  Uploading {len(video_files)} videos to S3 and database...")
-    
-    for video_info in video_files:
-        with open(video_info["path"], "rb") as video_file:
-            video_id = add_video(
-                user_id=user_id,
-                file_obj=video_file,
-                original_filename=video_info["path"].name,
-                title=video_info["subtopic_title"],
-                description=f"Subtopic {video_info['index']}/{len(subtopics)}",
-                collection_id=collection_id,
-            )
 
+    video_ids = add_videos_pipelined(
+        [
+            {
+                "path": video_info["path"],
+                "title": video_info["subtopic_title"],
+                "description": f"Subtopic {video_info['index']}/{len(subtopics)}",
+                "collection_id": collection_id,
+            }
+            for video_info in video_files
+        ],
+        user_id,
+    )
+
+    for video_info, video_id in zip(video_files, video_ids):
         results.append(
             {
                 "subtopic_title": video_info["subtopic_title"],
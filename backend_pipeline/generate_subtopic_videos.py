@@ -15,7 +15,7 @@ import os
 import random
 from pathlib import Path
 from typing import Any, Dict, List
-from save_to_db.save_video import add_video
+from save_to_db.save_video import add_videos_pipelined
 from save_to_db.collection_service import create_collection, generate_collection_title
 
 from backend_pipeline.audio_generation.elevenLabs import (
@@ -142,20 +142,23 @@ def generate_videos_from_subtopic_list(
             "audio_file": audio_result["audio_file"],
         })
 
-    # Step 3: Upload all videos to S3 and save to database with collection_id
+    # Step 3: Upload all videos to S3 with the DB inserts pipelined behind them
     print(f"\n☁️  Uploading {len(video_files)} videos to S3 and database...")
-    
-    for video_info in video_files:
-        with open(video_info["path"], "rb") as video_file:
-            video_id = add_video(
-                user_id=user_id,
-                file_obj=video_file,
-                original_filename=video_info["path"].name,
-                title=video_info["subtopic_title"],
-                description=f"Subtopic {video_info['index']}/{len(subtopics)}",
-                collection_id=collection_id,
-            )
 
+    video_ids = add_videos_pipelined(
+        [
+            {
+                "path": video_info["path"],
+                "title": video_info["subtopic_title"],
+                "description": f"Subtopic {video_info['index']}/{len(subtopics)}",
+                "collection_id": collection_id,
+            }
+            for video_info in video_files
+        ],
+        user_id,
+    )
+
+    for video_info, video_id in zip(video_files, video_ids):
         results.append(
             {
                 "subtopic_title": video_info["subtopic_title"],
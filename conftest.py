@@ -0,0 +1,35 @@
+"""Shared fixtures for the pipeline smoke tests.
+
+The test_*.py scripts double as manual smoke tests against a live DB,
+S3, and the rendering pipeline. The backend_pipeline imports behind them
+are heavy (moviepy, TTS, boto3), so the session-scoped fixtures below
+import them exactly once per pytest run instead of once per collected
+module — and only when a test actually uses them, so collection stays
+cheap when the asset-gated tests are skipped.
+"""
+
+import pytest
+
+# CLI-driven smoke scripts: their test_* helpers take --input/--type
+# style arguments, not fixtures, so pytest would collect them as
+# "fixture not found" errors. Run them directly instead.
+collect_ignore = [
+    "test_quiz_pipeline.py",
+    "test_quiz_api.py",
+]
+
+
+@pytest.fixture(scope="session")
+def quiz_generator():
+    """generate_quiz_video_from_file, imported once per session."""
+    from backend_pipeline.generate_quiz_video import generate_quiz_video_from_file
+
+    return generate_quiz_video_from_file
+
+
+@pytest.fixture(scope="session")
+def collection_generator():
+    """generate_complete_collection, imported once per session."""
+    from backend_pipeline.generate_complete_collection import generate_complete_collection
+
+    return generate_complete_collection
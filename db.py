@@ -1,10 +1,14 @@
 # db.py
 import os
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from dotenv import load_dotenv
 import psycopg2
 from psycopg2.extensions import connection as PGConnection
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
 load_dotenv()
 
@@ -12,10 +16,79 @@ DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL environment variable is not set")
 
+class PooledConnection(PGConnection):
+    """Pool connection with instance attribute support.
+
+    psycopg2's C connection type has no per-instance __dict__, so helpers
+    can't stash state on it (e.g. save_video's prepared-statement flag).
+    A Python subclass gets one for free; no behavior changes otherwise.
+    """
+
+
+# One shared pool per process. Created lazily so importing this module
+# doesn't open connections (e.g. in scripts that never touch the DB).
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    minconn=2,
+                    maxconn=20,
+                    dsn=DATABASE_URL,
+                    connection_factory=PooledConnection,
+                )
+    return _pool
+
+
+# ThreadedConnectionPool raises immediately when empty instead of
+# blocking, and the API offloads handlers onto more worker threads than
+# maxconn — so bursts briefly wait for a checkout rather than 500ing.
+_CHECKOUT_TIMEOUT = 10.0
+_CHECKOUT_RETRY_DELAY = 0.05
+
+
+def _checkout(pool: ThreadedConnectionPool) -> PGConnection:
+    deadline = time.monotonic() + _CHECKOUT_TIMEOUT
+    while True:
+        try:
+            return pool.getconn()
+        except PoolError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(_CHECKOUT_RETRY_DELAY)
+
+
+@contextmanager
+def db_conn() -> Iterator[PGConnection]:
+    """
+    Check a connection out of the shared pool and return it when done.
+
+    Replaces the connect-per-call get_db_conn()/close() pattern, which paid
+    a full TCP + Postgres auth round-trip for every query. putconn() rolls
+    back any open transaction, so read-only callers don't need to commit.
+    An exhausted pool waits up to _CHECKOUT_TIMEOUT for a connection to
+    come back before giving up.
+    """
+    pool = _get_pool()
+    conn = _checkout(pool)
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
 def get_db_conn() -> PGConnection:
     """
-    Return a psycopg2 connection to the Neon Postgres DB.
+    Return a dedicated (non-pooled) psycopg2 connection to the Neon Postgres DB.
     Uses DATABASE_URL env var.
+
+    Prefer the pooled db_conn() context manager; this remains for callers
+    that manage connection lifetime themselves.
     """
     # psycopg2 understands a full postgres:// URL DSN
     conn = psycopg2.connect(DATABASE_URL)
@@ -1,9 +1,25 @@
 CREATE TABLE IF NOT EXISTS users (
-    id          SERIAL PRIMARY KEY,
-    email       TEXT NOT NULL UNIQUE,
-    password    TEXT NOT NULL,
-    created_at  TIMESTAMPTZ DEFAULT NOW()
+    id            SERIAL PRIMARY KEY,
+    email         TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    created_at    TIMESTAMPTZ DEFAULT NOW()
 );
+-- The UNIQUE constraint on email doubles as the btree index the login
+-- path probes, so lookups never touch the password column in the scan.
+
+-- Databases created before the bcrypt switch have a plaintext `password`
+-- column; rename it in place (same idempotent style as the videos
+-- migrations below). Legacy plaintext values keep working — login
+-- upgrades them to bcrypt hashes on first successful authentication.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'users' AND column_name = 'password'
+    ) THEN
+        ALTER TABLE users RENAME COLUMN password TO password_hash;
+    END IF;
+END $$;
 
 CREATE TABLE IF NOT EXISTS videos (
     id                SERIAL PRIMARY KEY,
@@ -14,8 +30,35 @@ CREATE TABLE IF NOT EXISTS videos (
     created_at        TIMESTAMPTZ DEFAULT NOW()
 );
 
-INSERT INTO users (email, password)
-VALUES
-    ('alice@example.com', 'password1'),
-    ('bob@example.com',   'password2')
-ON CONFLICT (email) DO NOTHING;
+CREATE TABLE IF NOT EXISTS collections (
+    id               SERIAL PRIMARY KEY,
+    user_id          INT NOT NULL REFERENCES users(id),
+    collection_title TEXT,
+    created_at       TIMESTAMPTZ DEFAULT NOW()
+);
+
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS collection_id INT REFERENCES collections(id);
+
+-- Subtopic order lives in video_description ("Subtopic 3/7"). A stored
+-- generated column lets collection listings ORDER BY + LIMIT through the
+-- index below instead of regex-sorting every row in Python.
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS subtopic_number INT
+    GENERATED ALWAYS AS ((regexp_match(video_description, 'Subtopic (\d+)/'))[1]::int) STORED;
+
+CREATE INDEX IF NOT EXISTS videos_collection_subtopic_idx
+    ON videos (collection_id, subtopic_number);
+
+-- Object keys are unique in the bucket; the unique index lets sync
+-- inserts use ON CONFLICT (s3_key) DO NOTHING instead of probing first.
+CREATE UNIQUE INDEX IF NOT EXISTS videos_s3_key_uq ON videos (s3_key);
+
+-- Single-row watermark for incremental S3 sync: sync_db only examines
+-- objects with LastModified past last_synced_at instead of re-listing
+-- the whole bucket every run.
+CREATE TABLE IF NOT EXISTS sync_state (
+    id             INT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    last_synced_at TIMESTAMPTZ
+);
+
+-- Seed accounts via POST /accounts so password hashes are generated
+-- in-process with bcrypt; plaintext seeds are no longer valid.
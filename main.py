@@ -1,14 +1,26 @@
 import asyncio
+import hashlib
+import os
 import random
 import re
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List
 from uuid import uuid4
 
+import aiofiles
+from cachetools import TTLCache
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 
 from save_to_db.save_video import get_user_videos, get_collection_videos
-from save_to_db.collection_service import get_collection, get_user_collections, find_last_collection
+from save_to_db.collection_service import (
+    get_collection,
+    get_user_collections,
+    count_user_collections,
+    find_last_collection,
+)
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from frontend_pipeline.script_generation.transcripts import extract_transcripts, extract_quiz_transcripts
@@ -16,16 +28,62 @@ from backend_pipeline.generate_subtopic_videos import (
     generate_videos_from_subtopic_list,
 )
 from backend_pipeline.generate_quiz_video import generate_quiz_video
-import save_to_db.account_service as account_service
+from save_to_db import account_service
 
 BACKGROUND_VIDEOS_DIR = Path("assets/videos")
 OUTPUT_DIR = Path("assets/output")
 TEMP_UPLOAD_DIR = Path("tmp/uploads")
 GENERATED_AUDIO_DIR = Path("assets/audio/generated")
 
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-TEMP_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-GENERATED_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+# Uploads older than this are considered leaked (e.g. from a crash mid-request)
+# and are removed by the hourly background sweep.
+_TEMP_UPLOAD_MAX_AGE = 6 * 3600
+
+
+def _make_upload_shards():
+    """Pre-create the 256 hashed subdirectories of TEMP_UPLOAD_DIR.
+
+    Sharding by the first two hex chars of the upload id keeps each
+    directory small, so dirent scans stay cheap even if cleanup ever
+    falls behind and files accumulate.
+    """
+    for b in range(256):
+        (TEMP_UPLOAD_DIR / f"{b:02x}").mkdir(parents=True, exist_ok=True)
+
+
+def _prune_stale_uploads():
+    cutoff = time.time() - _TEMP_UPLOAD_MAX_AGE
+    for path in TEMP_UPLOAD_DIR.glob("*/*"):
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # raced with the request that owns the file; leave it
+
+
+async def _prune_stale_uploads_loop():
+    while True:
+        await asyncio.sleep(3600)
+        await asyncio.to_thread(_prune_stale_uploads)
+
+
+@asynccontextmanager
+async def lifespan(app: "FastAPI"):
+    """Run one-time startup work instead of repeating it per request/import.
+
+    Long-lived clients (S3, DB pool) are module-level singletons in their own
+    modules; this hook owns filesystem setup so worker processes don't pay it
+    on the request path.
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    GENERATED_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(_make_upload_shards)
+    _probe_background_videos()
+    prune_task = asyncio.create_task(_prune_stale_uploads_loop())
+    try:
+        yield
+    finally:
+        prune_task.cancel()
 
 
 class DialogueLine(BaseModel):
@@ -69,7 +127,11 @@ class QuizRequest(BaseModel):
 app = FastAPI(
     title="Video Generation API",
     description="API for generating videos from slides",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Rust-backed JSON encoding; handles the datetimes in video/account
+    # rows natively and is much faster on large results lists.
+    default_response_class=ORJSONResponse,
 )
 
 # CORS settings so React (localhost:3000) can talk to this API
@@ -108,73 +170,165 @@ async def _run_blocking(func, *args, **kwargs):
 
 
 
+# Result of the one-time background-assets probe; the directory only changes
+# with a deploy, so there's no reason to stat + glob it per request.
+_bg_videos_error: str | None = None
+_bg_videos_probed = False
+
+
+def _probe_background_videos():
+    """Stat the background videos directory once and remember the outcome."""
+    global _bg_videos_error, _bg_videos_probed
+    if not BACKGROUND_VIDEOS_DIR.exists():
+        _bg_videos_error = f"Background videos directory not found at {BACKGROUND_VIDEOS_DIR}"
+    elif not list(BACKGROUND_VIDEOS_DIR.glob("*.mp4")):
+        _bg_videos_error = f"No background videos found in {BACKGROUND_VIDEOS_DIR}"
+    else:
+        _bg_videos_error = None
+    _bg_videos_probed = True
+
+
 def _validate_background_video():
     """Validate that the background videos directory exists and has videos."""
-    if not BACKGROUND_VIDEOS_DIR.exists():
-        raise HTTPException(
-            status_code=500,
-            detail=f"Background videos directory not found at {BACKGROUND_VIDEOS_DIR}",
-        )
-    
-    video_files = list(BACKGROUND_VIDEOS_DIR.glob("*.mp4"))
-    if not video_files:
-        raise HTTPException(
-            status_code=500,
-            detail=f"No background videos found in {BACKGROUND_VIDEOS_DIR}",
-        )
+    if not _bg_videos_probed:
+        _probe_background_videos()
+    if _bg_videos_error:
+        raise HTTPException(status_code=500, detail=_bg_videos_error)
+
+
+def _drop_page_cache(path: Path):
+    """Tell the kernel not to keep this file's pages cached, so the hot
+    background-video assets aren't evicted under sustained uploads.
+
+    DONTNEED ignores dirty pages, and right after the copy the upload's
+    pages are all still dirty — fsync first so the advice has something
+    clean to evict.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
 
+async def _move_upload_to_disk(upload: UploadFile, destination: Path) -> str:
+    """Stream the upload to disk without blocking the event loop.
 
-def _move_upload_to_disk(upload: UploadFile, destination: Path):
-    with destination.open("wb") as buffer:
-        while True:
-            chunk = upload.file.read(1024 * 1024)
-            if not chunk:
-                break
-            buffer.write(chunk)
-    upload.file.close()
+    UploadFile.read is already async; aiofiles pushes the disk writes onto
+    a worker thread, so concurrent uploads no longer serialize the loop.
+
+    Returns the SHA-256 hex digest of the content, hashed while writing so
+    the transcript cache doesn't need a second pass over the file.
+    """
+    digest = hashlib.sha256()
+    try:
+        async with aiofiles.open(destination, "wb") as buffer:
+            while chunk := await upload.read(8 * 1024 * 1024):
+                digest.update(chunk)
+                await buffer.write(chunk)
+        await asyncio.to_thread(_drop_page_cache, destination)
+    finally:
+        await upload.close()
+    return digest.hexdigest()
+
+
+# Concurrent /generate-video requests for the same source share a single
+# in-flight model call instead of each paying a full extraction, and results
+# are cached by content hash for an hour — extraction dominates the endpoint,
+# so resubmitting the same text/URL/audio becomes a dict lookup.
+_inflight_extractions: dict = {}
+_transcript_cache: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
+
+async def _extract_shared(extract_func, source, source_type, cache_basis=None):
+    # For audio, source is a one-shot temp path; the caller passes the file's
+    # SHA-256 instead so identical uploads hit the same cache entry.
+    basis = cache_basis if cache_basis is not None else source
+    key = hashlib.sha256(
+        f"{extract_func.__name__}|{source_type}|{basis}".encode()
+    ).hexdigest()
+
+    cached = _transcript_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _inflight_extractions.get(key)
+    if task is None:
+        task = asyncio.create_task(_run_blocking(extract_func, source, source_type))
+        _inflight_extractions[key] = task
+        task.add_done_callback(lambda _t: _inflight_extractions.pop(key, None))
+    # shield: one caller giving up must not cancel the call for the others
+    result = await asyncio.shield(task)
+    if result:
+        _transcript_cache[key] = result
+    return result
+
+
+# Compiled once at import; the old per-call list of three patterns meant
+# three scans (plus list/generator allocations) per /generate-video request.
+_YOUTUBE_RE = re.compile(
+    r'(?:https?://)?(?:www\.)?(?:youtube\.com|youtu\.be)/',
+    re.IGNORECASE,
+)
 
 
 def _is_youtube_url(text: str) -> bool:
     """Check if a string is a YouTube URL."""
-    if not text:
-        return False
-    youtube_patterns = [
-        r'(https?://)?(www\.)?(youtube\.com|youtu\.be)/',
-        r'youtube\.com/watch\?v=',
-        r'youtu\.be/',
-    ]
-    return any(re.search(pattern, text, re.IGNORECASE) for pattern in youtube_patterns)
+    return bool(text) and _YOUTUBE_RE.search(text) is not None
 
 
-async def _generate_videos(user_id, subtopics, prefix: str):
+def _session_dirs(prefix: str) -> tuple[Path, Path]:
+    """Pick the video/audio output directories for a new session."""
     session_id = uuid4().hex
-    video_output_dir = OUTPUT_DIR / f"{prefix}_{session_id}"
-    audio_output_dir = GENERATED_AUDIO_DIR / f"{prefix}_{session_id}"
-    
-    # Pass the videos directory so each subtopic can randomly select its own background
-    return await _run_blocking(
-        generate_videos_from_subtopic_list,
-        subtopics,
-        str(BACKGROUND_VIDEOS_DIR),
-        str(video_output_dir),
-        str(audio_output_dir),
-        user_id,
+    return (
+        OUTPUT_DIR / f"{prefix}_{session_id}",
+        GENERATED_AUDIO_DIR / f"{prefix}_{session_id}",
     )
 
-async def _generate_quiz_videos(user_id, quiz_modules, prefix: str):
-    session_id = uuid4().hex
-    video_output_dir = OUTPUT_DIR / f"{prefix}_{session_id}"
-    audio_output_dir = GENERATED_AUDIO_DIR / f"{prefix}_{session_id}"
-    
-    # Pass the videos directory so each subtopic can randomly select its own background
-    return await _run_blocking(
-        generate_quiz_video,
-        quiz_modules,
-        str(BACKGROUND_VIDEOS_DIR),
-        str(video_output_dir),
-        str(audio_output_dir),
-        user_id,
-    )
+
+def _make_dirs(*dirs: Path):
+    for directory in dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def _dump_models(items) -> list[dict]:
+    """Convert Pydantic models to plain dicts (runs in the worker thread, so
+    large payloads don't stall the event loop building two object trees)."""
+    return [item.model_dump() if isinstance(item, BaseModel) else item for item in items]
+
+
+async def _generate_videos(user_id, subtopics, prefix: str, dirs: tuple[Path, Path] | None = None):
+    video_output_dir, audio_output_dir = dirs or _session_dirs(prefix)
+
+    def _work():
+        # Pass the videos directory so each subtopic can randomly select its own background
+        return generate_videos_from_subtopic_list(
+            _dump_models(subtopics),
+            str(BACKGROUND_VIDEOS_DIR),
+            str(video_output_dir),
+            str(audio_output_dir),
+            user_id,
+        )
+
+    return await _run_blocking(_work)
+
+async def _generate_quiz_videos(user_id, quiz_modules, prefix: str, dirs: tuple[Path, Path] | None = None):
+    video_output_dir, audio_output_dir = dirs or _session_dirs(prefix)
+
+    def _work():
+        # Pass the videos directory so each subtopic can randomly select its own background
+        return generate_quiz_video(
+            _dump_models(quiz_modules),
+            str(BACKGROUND_VIDEOS_DIR),
+            str(video_output_dir),
+            str(audio_output_dir),
+            user_id,
+        )
+
+    return await _run_blocking(_work)
 
 async def generate_video_from_subtopics(payload: SubtopicRequest, user_id: int = 1):
     _validate_background_video()
@@ -185,7 +339,7 @@ async def generate_video_from_subtopics(payload: SubtopicRequest, user_id: int =
     session_id = uuid4().hex
     video_results = await _generate_videos(
         user_id,
-        [subtopic.model_dump() for subtopic in payload.subtopic_transcripts],
+        payload.subtopic_transcripts,
         prefix="direct",
     )
 
@@ -218,6 +372,7 @@ async def generate_video(
     temp_audio_path = None
     transcript_source = None
     transcript_type = None
+    content_digest = None
 
     try:
         # Auto-detect input type
@@ -238,8 +393,11 @@ async def generate_video(
             if not file:
                 raise HTTPException(status_code=400, detail="Audio file is required.")
             suffix = Path(file.filename or "").suffix or ".mp3"
-            temp_audio_path = TEMP_UPLOAD_DIR / f"{uuid4().hex}{suffix}"
-            _move_upload_to_disk(file, temp_audio_path)
+            upload_name = uuid4().hex
+            # Shard by the first two hex chars so no single directory grows huge
+            temp_audio_path = TEMP_UPLOAD_DIR / upload_name[:2] / f"{upload_name}{suffix}"
+            temp_audio_path.parent.mkdir(parents=True, exist_ok=True)
+            content_digest = await _move_upload_to_disk(file, temp_audio_path)
             transcript_source = str(temp_audio_path)
             transcript_type = "audio/mp3"
         elif input_type == "text":
@@ -253,13 +411,32 @@ async def generate_video(
             transcript_source = content
             transcript_type = "youtube"
 
-        subtopics = await _run_blocking(
-            extract_transcripts,
-            transcript_source,
-            transcript_type,
+        # Both extraction calls only depend on the source, so run them
+        # concurrently instead of paying two model round-trips back to back.
+        # The quiz task keeps running while the subtopic videos render below.
+        subtopics_task = asyncio.create_task(
+            _extract_shared(extract_transcripts, transcript_source, transcript_type, content_digest)
         )
-        
+        quiz_modules_task = asyncio.create_task(
+            _extract_shared(extract_quiz_transcripts, transcript_source, transcript_type, content_digest)
+        )
+
+        # Prepare the session output directories while the model calls are in
+        # flight, so the filesystem setup is off the critical path.
+        session_dirs = _session_dirs("session")
+        quiz_dirs = _session_dirs("quiz_session")
+        dirs_task = asyncio.create_task(
+            asyncio.to_thread(_make_dirs, *session_dirs, *quiz_dirs)
+        )
+
+        try:
+            subtopics = await subtopics_task
+        except Exception:
+            quiz_modules_task.cancel()
+            raise
+
         if not subtopics:
+            quiz_modules_task.cancel()
             detail = {
                 "error": "model_returned_no_subtopics",
                 "input_type": input_type,
@@ -267,18 +444,17 @@ async def generate_video(
             }
             raise HTTPException(status_code=502, detail=detail)
 
+        await dirs_task
         video_results = await _generate_videos(
             user_id,
-            [subtopic.model_dump() for subtopic in subtopics],
+            subtopics,
             prefix="session",
+            dirs=session_dirs,
         )
 
-        # Generate quiz modules (wrap in _run_blocking since it's synchronous)
-        quiz_modules = await _run_blocking(
-            extract_quiz_transcripts,
-            transcript_source,
-            transcript_type,
-        )
+        # Quiz extraction was started alongside the subtopic extraction and has
+        # been overlapping with video generation; collect its result now.
+        quiz_modules = await quiz_modules_task
 
         if not quiz_modules:
             detail = {
@@ -290,8 +466,9 @@ async def generate_video(
         
         quiz_results = await _generate_quiz_videos(
             user_id,
-            [quiz_module.model_dump() for quiz_module in quiz_modules],
+            quiz_modules,
             prefix="quiz_session",
+            dirs=quiz_dirs,
         )
 
         # Get the last collection ID (wrap in _run_blocking)
@@ -316,22 +493,31 @@ def get_current_user_id() -> int:
     return 1
 
 
+# Compiled once; _extract_subtopic_number runs per video on listing paths,
+# so per-call re.search pattern lookups add up.
+_SUB_DESC_RE = re.compile(r'Subtopic\s*(\d+)/\d+', re.IGNORECASE)
+_SUB_TITLE_RE = re.compile(r'subtopic[_\s]?(\d+)', re.IGNORECASE)
+
+
 def _extract_subtopic_number(video: dict) -> int:
     """Extract subtopic number from video title or description, otherwise return a high number."""
+    # 'ubtopic' in s is a C-level byte scan that rejects the common
+    # non-matching strings before the regex engine ever starts; the odd
+    # spelling keeps the check case-insensitive without lowering first.
     # Check description first for "Subtopic X/Y" pattern
     description = video.get('description', '')
-    if description:
-        match = re.search(r'Subtopic\s*(\d+)/\d+', description, re.IGNORECASE)
+    if description and ('ubtopic' in description or 'UBTOPIC' in description.upper()):
+        match = _SUB_DESC_RE.search(description)
         if match:
             return int(match.group(1))
-    
+
     # Check title for patterns like "subtopic_1", "subtopic 1", or numbers
     title = video.get('title', '')
-    if title:
-        match = re.search(r'subtopic[_\s]?(\d+)', title, re.IGNORECASE)
+    if title and ('ubtopic' in title or 'UBTOPIC' in title.upper()):
+        match = _SUB_TITLE_RE.search(title)
         if match:
             return int(match.group(1))
-    
+
     # If no explicit subtopic, return a high number to sort to the end
     return 999999
 
@@ -361,20 +547,17 @@ async def list_user_videos(
             collection_limit,
         )
         
-        # Get total count of collections for pagination info
-        all_collections = await _run_blocking(
-            get_user_collections,
-            user_id,
-            0,
-            1000,  # High limit to get count
-        )
-        total_collections = len(all_collections)
+        # Get total count of collections for pagination info via SQL COUNT
+        # instead of fetching up to 1000 full rows just to len() them
+        total_collections = await _run_blocking(count_user_collections, user_id)
         
-        # Step 2: Fetch videos ONLY for these specific collections
-        result_videos = []
+        # Step 2: Fetch videos ONLY for these specific collections.
+        # Sanitize in the same pass (drop internal fields) so each video is
+        # walked once instead of collecting everything and re-scanning.
+        sanitized_videos = []
         for collection in collections:
             coll_id = collection["id"]
-            
+
             # Fetch videos for this specific collection
             collection_videos = await _run_blocking(
                 get_collection_videos,
@@ -382,15 +565,12 @@ async def list_user_videos(
                 0,
                 50,
             )
-            
+
             # Videos are already sorted by subtopic in get_collection_videos
-            result_videos.extend(collection_videos)
-        
-        # Sanitize videos (remove internal fields)
-        sanitized_videos = [
-            {k: v for k, v in video.items() if k not in ["s3_key", "created_at", "user_id"]}
-            for video in result_videos
-        ]
+            sanitized_videos.extend(
+                {k: v for k, v in video.items() if k not in ("s3_key", "created_at", "user_id")}
+                for video in collection_videos
+            )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -495,12 +675,19 @@ class UserUpdatePassword(BaseModel):
     new_password: str
 
 
+# Account reads change rarely but get hammered in bursts; a short TTL cache
+# coalesces those bursts into one DB call while bounding staleness to 5s.
+_user_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+_user_list_cache: TTLCache = TTLCache(maxsize=128, ttl=5)
+
+
 @app.post("/accounts")
 async def register_account(user: UserCreate):
     """Create a new user account."""
     result = await _run_blocking(account_service.create_user, user.email, user.password)
     if result is None:
         raise HTTPException(status_code=400, detail="Email already exists")
+    _user_list_cache.clear()
     return {"message": "Account created", "user": result}
 
 
@@ -516,14 +703,28 @@ async def login_account(credentials: UserLogin):
 @app.get("/accounts/{user_id}")
 async def get_account(user_id: int):
     """Get user account by ID."""
-    result = await _run_blocking(account_service.get_user_by_id, user_id)
+    result = _user_cache.get(user_id)
     if result is None:
-        raise HTTPException(status_code=404, detail="User not found")
+        result = await _run_blocking(account_service.get_user_by_id, user_id)
+        if result is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        _user_cache[user_id] = result
     return result
 
 
 @app.get("/accounts")
-async def list_accounts():
-    """List all user accounts."""
-    users = await _run_blocking(account_service.list_all_users)
-    return {"count": len(users), "users": users}
\ No newline at end of file
+async def list_accounts(
+    after_id: int = Query(0, ge=0, description="Return users with id greater than this"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of users to return"),
+):
+    """List user accounts a page at a time (keyset pagination)."""
+    cache_key = (after_id, limit)
+    users = _user_list_cache.get(cache_key)
+    if users is None:
+        users = await _run_blocking(account_service.list_all_users, after_id, limit)
+        _user_list_cache[cache_key] = users
+    return {
+        "count": len(users),
+        "users": users,
+        "next_cursor": users[-1]["id"] if len(users) == limit else None,
+    }
\ No newline at end of file
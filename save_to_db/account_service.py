@@ -1,43 +1,48 @@
 """Simple account service using psycopg2 for CRUD operations."""
 
+import hmac
 from typing import Optional, Dict, List
 
-import psycopg2
-from db import get_db_conn  # <-- use shared DB helper
+import bcrypt
+from db import db_conn  # <-- use shared pooled DB helper
+
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(12)).decode("utf-8")
 
 
 def create_user(email: str, password: str) -> Optional[Dict]:
     """
-    Create a new user account.
+    Create a new user account. The password is stored as a bcrypt hash.
+
+    Duplicate emails are handled with ON CONFLICT DO NOTHING, so the
+    conflict path returns cleanly without a rollback round-trip or a
+    dead tuple from an aborted insert.
 
     Returns:
         User dict with id, email if successful, None if email exists
     """
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
-                INSERT INTO users (email, password)
+                INSERT INTO users (email, password_hash)
                 VALUES (%s, %s)
+                ON CONFLICT (email) DO NOTHING
                 RETURNING id, email, created_at
                 """,
-                (email, password),
+                (email, _hash_password(password)),
             )
             row = cur.fetchone()
             conn.commit()
+            if row is None:
+                return None
             return {"id": row[0], "email": row[1], "created_at": row[2]}
-    except psycopg2.IntegrityError:
-        conn.rollback()
-        return None
-    finally:
-        conn.close()
 
 
 def get_user_by_id(user_id: int) -> Optional[Dict]:
     """Get user by ID."""
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT id, email, created_at FROM users WHERE id = %s",
@@ -47,14 +52,11 @@ def get_user_by_id(user_id: int) -> Optional[Dict]:
             if row:
                 return {"id": row[0], "email": row[1], "created_at": row[2]}
             return None
-    finally:
-        conn.close()
 
 
 def get_user_by_email(email: str) -> Optional[Dict]:
     """Get user by email."""
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT id, email, created_at FROM users WHERE email = %s",
@@ -64,34 +66,56 @@ def get_user_by_email(email: str) -> Optional[Dict]:
             if row:
                 return {"id": row[0], "email": row[1], "created_at": row[2]}
             return None
-    finally:
-        conn.close()
 
 
 def authenticate_user(email: str, password: str) -> Optional[Dict]:
     """
     Authenticate user by email and password.
 
+    Looks the row up by email alone (served by the unique email index) and
+    verifies the bcrypt hash in-process instead of comparing in the DB.
+
+    Rows written before the bcrypt switch still hold plaintext (the
+    init.sql migration only renames the column); those are compared
+    directly and upgraded to a bcrypt hash on successful login.
+
     Returns:
         User dict if credentials valid, None otherwise
     """
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
-                SELECT id, email, created_at
+                SELECT id, email, created_at, password_hash
                 FROM users
-                WHERE email = %s AND password = %s
+                WHERE email = %s
                 """,
-                (email, password),
+                (email,),
             )
             row = cur.fetchone()
-            if row:
+            if row is None:
+                return None
+            stored = row[3]
+            try:
+                valid = bcrypt.checkpw(
+                    password.encode("utf-8"), stored.encode("utf-8")
+                )
+            except ValueError:
+                # Not a bcrypt hash: legacy plaintext row. A mismatch is
+                # an auth failure, not a server error. Compare as bytes —
+                # compare_digest rejects non-ASCII str input.
+                valid = hmac.compare_digest(
+                    stored.encode("utf-8"), password.encode("utf-8")
+                )
+                if valid:
+                    cur.execute(
+                        "UPDATE users SET password_hash = %s WHERE id = %s",
+                        (_hash_password(password), row[0]),
+                    )
+                    conn.commit()
+            if valid:
                 return {"id": row[0], "email": row[1], "created_at": row[2]}
             return None
-    finally:
-        conn.close()
 
 
 def update_password(user_id: int, new_password: str) -> bool:
@@ -101,17 +125,14 @@ def update_password(user_id: int, new_password: str) -> bool:
     Returns:
         True if successful, False if user not found
     """
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                "UPDATE users SET password = %s WHERE id = %s",
-                (new_password, user_id),
+                "UPDATE users SET password_hash = %s WHERE id = %s",
+                (_hash_password(new_password), user_id),
             )
             conn.commit()
             return cur.rowcount > 0
-    finally:
-        conn.close()
 
 
 def delete_user(user_id: int) -> bool:
@@ -121,28 +142,34 @@ def delete_user(user_id: int) -> bool:
     Returns:
         True if successful, False if user not found
     """
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute("DELETE FROM users WHERE id = %s", (user_id,))
             conn.commit()
             return cur.rowcount > 0
-    finally:
-        conn.close()
 
 
-def list_all_users() -> List[Dict]:
-    """Get all users."""
-    conn = get_db_conn()
-    try:
+def list_all_users(after_id: int = 0, limit: int = 100) -> List[Dict]:
+    """Get users a page at a time via keyset pagination.
+
+    WHERE id > after_id ORDER BY id LIMIT is served straight off the
+    primary key, so each call does work proportional to the page size
+    instead of shipping the whole table.
+    """
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                "SELECT id, email, created_at FROM users ORDER BY id"
+                """
+                SELECT id, email, created_at
+                FROM users
+                WHERE id > %s
+                ORDER BY id
+                LIMIT %s
+                """,
+                (after_id, limit),
             )
             rows = cur.fetchall()
             return [
                 {"id": row[0], "email": row[1], "created_at": row[2]}
                 for row in rows
             ]
-    finally:
-        conn.close()
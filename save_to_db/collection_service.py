@@ -1,11 +1,85 @@
 """Collection service for grouping related videos."""
 
+import hashlib
 import os
+import time
 from typing import Optional, Dict, List
-from db import get_db_conn
+from cachetools import TTLCache
+from psycopg2.extras import RealDictCursor
+from db import db_conn
 import google.genai as genai
+from google.genai import types as genai_types
 from dotenv import load_dotenv
 
+# Generated titles are deterministic for a given subtopic list, so retries
+# and duplicate pipeline runs should not pay the ~500ms Gemini call twice.
+_title_cache: TTLCache = TTLCache(maxsize=512, ttl=24 * 3600)
+
+# Static instruction prefix for title generation; only the bulleted
+# subtopic list varies per call, so the prefix is a candidate for
+# Gemini's server-side context cache.
+_TITLE_PROMPT_INSTRUCTIONS = """Generate a concise, engaging title (max 60 characters) for a video collection based on the subtopics listed by the user.
+
+Requirements:
+- Must be 60 characters or less
+- Should capture the main theme or topic
+- Should be engaging and clear
+- Do not use quotes or special formatting
+- Return ONLY the title, nothing else"""
+
+_prompt_cache_name: Optional[str] = None
+_prompt_cache_expires_at: float = 0.0
+
+# .env is parsed once at import; the Gemini client (HTTP session, auth)
+# is built lazily on first use and shared by every title generation.
+load_dotenv()
+
+_genai_client: Optional[genai.Client] = None
+
+
+def _get_genai_client() -> genai.Client:
+    global _genai_client
+    if _genai_client is None:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not set")
+        _genai_client = genai.Client(api_key=api_key)
+    return _genai_client
+
+
+def _get_prompt_cache_name(client) -> Optional[str]:
+    """
+    Register the static title-prompt prefix with Gemini's context cache,
+    reusing the handle until shortly before its server-side TTL lapses.
+
+    Returns None when context caching is unavailable (e.g. the prefix is
+    below the model's minimum cacheable size); callers then send the full
+    prompt as before. Failures back off for 10 minutes rather than
+    retrying the create on every title.
+    """
+    global _prompt_cache_name, _prompt_cache_expires_at
+
+    now = time.time()
+    if now < _prompt_cache_expires_at:
+        return _prompt_cache_name
+
+    try:
+        cache = client.caches.create(
+            model="gemini-2.5-flash",
+            config=genai_types.CreateCachedContentConfig(
+                contents=[_TITLE_PROMPT_INSTRUCTIONS],
+                ttl="3600s",
+            ),
+        )
+        _prompt_cache_name = cache.name
+        # Refresh a few minutes before the server-side TTL expires
+        _prompt_cache_expires_at = now + 3300
+    except Exception:
+        _prompt_cache_name = None
+        _prompt_cache_expires_at = now + 600
+
+    return _prompt_cache_name
+
 
 def create_collection(
     user_id: int,
@@ -21,9 +95,7 @@ def create_collection(
     Returns:
         The new collection id
     """
-    conn = get_db_conn()
-    conn.autocommit = True
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -37,9 +109,8 @@ def create_collection(
             if row is None:
                 raise RuntimeError("INSERT INTO collections RETURNING id returned no row")
             collection_id = row[0]
-            return int(collection_id)
-    finally:
-        conn.close()
+        conn.commit()
+        return int(collection_id)
 
 
 def get_collection(collection_id: int) -> Optional[Dict]:
@@ -49,8 +120,7 @@ def get_collection(collection_id: int) -> Optional[Dict]:
     Returns:
         Collection dict with id, user_id, collection_title, created_at
     """
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -69,8 +139,6 @@ def get_collection(collection_id: int) -> Optional[Dict]:
                     "created_at": row[3],
                 }
             return None
-    finally:
-        conn.close()
 
 
 def get_user_collections(
@@ -84,9 +152,8 @@ def get_user_collections(
     Returns:
         List of collection dicts, ordered by newest first
     """
-    conn = get_db_conn()
-    try:
-        with conn.cursor() as cur:
+    with db_conn() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
                 """
                 SELECT id, user_id, collection_title, created_at
@@ -98,18 +165,18 @@ def get_user_collections(
                 """,
                 (user_id, offset, limit),
             )
-            rows = cur.fetchall()
-            return [
-                {
-                    "id": row[0],
-                    "user_id": row[1],
-                    "collection_title": row[2],
-                    "created_at": row[3],
-                }
-                for row in rows
-            ]
-    finally:
-        conn.close()
+            return [dict(row) for row in cur.fetchall()]
+
+
+def count_user_collections(user_id: int) -> int:
+    """Count a user's collections without shipping the rows over the wire."""
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) FROM collections WHERE user_id = %s",
+                (user_id,),
+            )
+            return int(cur.fetchone()[0])
 
 
 def generate_collection_title(subtopic_titles: List[str]) -> str:
@@ -128,37 +195,42 @@ def generate_collection_title(subtopic_titles: List[str]) -> str:
     # If there's only one subtopic, use it directly
     if len(subtopic_titles) == 1:
         return subtopic_titles[0]
-    
+
+    # Same subtopics (in any order) -> same title, straight from cache
+    cache_key = hashlib.sha256(
+        "\n".join(sorted(subtopic_titles)).encode("utf-8")
+    ).hexdigest()
+    cached_title = _title_cache.get(cache_key)
+    if cached_title is not None:
+        return cached_title
+
     try:
-        # Load API key
-        load_dotenv()
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not set")
-        
-        # Initialize Gemini client
-        client = genai.Client(api_key=api_key)
-        
+        # Shared Gemini client (built once, reused across calls)
+        client = _get_genai_client()
+
         # Create prompt for title generation
         subtopic_list = "\n".join([f"- {title}" for title in subtopic_titles])
-        prompt = f"""Generate a concise, engaging title (max 60 characters) for a video collection based on these subtopics:
 
-{subtopic_list}
+        # With a context-cache handle only the variable subtopic list is
+        # sent per call; otherwise fall back to the full prompt.
+        cache_name = _get_prompt_cache_name(client)
+        if cache_name:
+            response = client.models.generate_content(
+                model="gemini-2.5-flash",
+                contents=f"Subtopics:\n{subtopic_list}\n\nTitle:",
+                config=genai_types.GenerateContentConfig(cached_content=cache_name),
+            )
+        else:
+            prompt = f"""{_TITLE_PROMPT_INSTRUCTIONS}
 
-Requirements:
-- Must be 60 characters or less
-- Should capture the main theme or topic
-- Should be engaging and clear
-- Do not use quotes or special formatting
-- Return ONLY the title, nothing else
+Subtopics:
+{subtopic_list}
 
 Title:"""
-        
-        # Call Gemini API
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt,
-        )
+            response = client.models.generate_content(
+                model="gemini-2.5-flash",
+                contents=prompt,
+            )
         
         # Extract the generated title
         if response and response.text:
@@ -168,6 +240,7 @@ Title:"""
             # Truncate if too long
             if len(title) > 60:
                 title = title[:57] + "..."
+            _title_cache[cache_key] = title
             return title
         
     except Exception as e:
@@ -188,8 +261,7 @@ def find_last_collection(user_id: int) -> Optional[Dict]:
     Returns:
         The most recent collection dict or None
     """
-    conn = get_db_conn()
-    try:
+    with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -207,5 +279,3 @@ def find_last_collection(user_id: int) -> Optional[Dict]:
                     "id": row[0]
                 }
             return None
-    finally:
-        conn.close()
\ No newline at end of file
@@ -1,58 +1,513 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import heapq
 from pathlib import Path
 from uuid import uuid4
 import mimetypes
+import os
 import re
-from typing import BinaryIO, Dict, Any, List, Optional
+import socket
+import threading
+import time
+from typing import BinaryIO, Dict, Any, Iterable, List, Optional
 
 import boto3
-
-from db import get_db_conn  # shared DB connection
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError
+
+try:
+    # Optional native transfer path: awscrt runs multipart uploads in C
+    # with its own IO threads instead of GIL-bound Python workers.
+    from s3transfer.crt import CRTTransferManager, create_s3_crt_client
+except ImportError:  # awscrt not installed; thread-pooled boto3 still works
+    CRTTransferManager = None
+    create_s3_crt_client = None
+
+try:
+    # Optional cross-worker presign cache; without redis (or REDIS_URL)
+    # the per-process LRU below still does the work.
+    import redis
+except ImportError:
+    redis = None
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+from db import db_conn  # shared pooled DB helper
 
 BUCKET_NAME = "emory-hacks-video-bucket"
 
-# Reuse one S3 client for the whole program
-s3 = boto3.client("s3")  # uses your AWS configured creds
+# One S3 client per process, built lazily on first use (client
+# construction loads endpoint/service metadata and costs more than the
+# calls it serves). The pool is sized so that parallel uploads/presigns
+# don't serialize on urllib3 connection checkout.
+_s3_client = None
+_s3_lock = threading.Lock()
+
+
+def _resolve_region() -> str:
+    """Resolve the AWS region through the full config chain.
+
+    Env vars first (cheap), then boto3's session resolver, which also
+    reads ~/.aws/config — profile-only setups must not get pinned to the
+    wrong regional endpoint. us-east-1 is the last resort.
+    """
+    return (
+        os.getenv("AWS_REGION")
+        or os.getenv("AWS_DEFAULT_REGION")
+        or boto3.session.Session().region_name
+        or "us-east-1"
+    )
+
+
+def get_s3_client():
+    """Return the shared S3 client, constructing it exactly once.
+
+    Region and endpoint are pinned so botocore doesn't walk its endpoint
+    resolver on every request (it dominates presign cost otherwise), and
+    virtual-hosted addressing + SigV4 are fixed up front for the same
+    reason. Credentials still come from the normal AWS config chain.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_lock:
+            if _s3_client is None:
+                region = _resolve_region()
+                _s3_client = boto3.client(
+                    "s3",
+                    region_name=region,
+                    endpoint_url=f"https://s3.{region}.amazonaws.com",
+                    config=Config(
+                        max_pool_connections=32,
+                        signature_version="s3v4",
+                        s3={"addressing_style": "virtual"},
+                        tcp_keepalive=True,
+                    ),
+                )
+                _widen_socket_buffers(_s3_client)
+    return _s3_client
+
+
+def _widen_socket_buffers(client) -> None:
+    """Ask for 1 MiB send/receive socket buffers on the client's HTTP session.
+
+    Stdlib HTTP defaults to 8 KB buffers, which caps single-stream S3
+    throughput well below what the link can carry. botocore doesn't
+    expose socket options publicly, so this reaches into its urllib3
+    session before any connection pool exists — best effort, and
+    harmless to skip if those internals move.
+    """
+    buf_opts = [
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+    ]
+    try:
+        http_session = client._endpoint.http_session
+        http_session._socket_options = list(http_session._socket_options or []) + buf_opts
+    except AttributeError:
+        pass
+
+
+# The formats we actually see; covers uploads without the per-call
+# mimetypes map walk (guess_type stays as the fallback for odd files).
+_EXT_TO_MIME = {
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".webm": "video/webm",
+    ".m4v": "video/x-m4v",
+    ".mp3": "audio/mpeg",
+}
+
+# Multipart settings for video uploads: 16 MiB parts with up to 20 in
+# flight, so a single large file uses the whole pipe instead of one
+# serial stream. Fewer, bigger parts keep the per-part request overhead
+# down on multi-hundred-MB videos.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=20,
+    use_threads=True,
+)
+
+
+@lru_cache(maxsize=4096)
+def _presign_cached(key: str, expiry_bucket: int) -> str:
+    return get_s3_client().generate_presigned_url(
+        "get_object",
+        Params={"Bucket": BUCKET_NAME, "Key": key},
+        ExpiresIn=3600,  # 1 hour
+    )
+
+
+_redis_client = None
+_redis_lock = threading.Lock()
+
+
+def _get_redis():
+    """Shared Redis client for the cross-worker presign cache.
+
+    Returns None when the redis package isn't installed or REDIS_URL
+    isn't set, in which case callers fall back to the per-process LRU.
+    """
+    global _redis_client
+    if redis is None:
+        return None
+    if _redis_client is None:
+        url = os.getenv("REDIS_URL")
+        if not url:
+            return None
+        with _redis_lock:
+            if _redis_client is None:
+                _redis_client = redis.Redis.from_url(url, decode_responses=True)
+    return _redis_client
+
+
+def _presign(key: str) -> str:
+    """Presign a GET URL, reusing signatures within a 5-minute bucket.
+
+    Signing is pure HMAC work, so paginated listings re-signing the same
+    keys within a few minutes get dict-lookup hits instead; the bucket is
+    far shorter than the 1h validity, so cached URLs stay usable. With
+    REDIS_URL set, the bucketed URL is also shared across workers (and
+    stays stable for clients, so browsers can cache the object); Redis
+    being down just drops back to per-process signing.
+    """
+    expiry_bucket = int(time.time()) // 300
+    r = _get_redis()
+    if r is None:
+        return _presign_cached(key, expiry_bucket)
+
+    redis_key = f"psu:{expiry_bucket}:{key}"
+    try:
+        url = r.get(redis_key)
+        if url:
+            return url
+    except Exception:
+        return _presign_cached(key, expiry_bucket)
+
+    url = _presign_cached(key, expiry_bucket)
+    try:
+        r.setex(redis_key, 1800, url)
+    except Exception:
+        pass
+    return url
+
+
+# One long-lived pool for URL signing; spawning a fresh executor (and 8
+# threads) per listing call cost more than the signing it parallelized.
+_SIGN_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="presign")
+
+
+def _presign_many(keys: Iterable[str]) -> List[str]:
+    """Presign a batch of keys in parallel, preserving order."""
+    keys = list(keys)
+    if len(keys) <= 1:
+        return [_presign(k) for k in keys]
+    return list(_SIGN_POOL.map(_presign, keys))
+
+
+_crt_manager = None
+_crt_lock = threading.Lock()
+
+
+def _get_crt_manager():
+    """Shared CRTTransferManager, or None when awscrt isn't installed."""
+    global _crt_manager
+    if CRTTransferManager is None:
+        return None
+    if _crt_manager is None:
+        with _crt_lock:
+            if _crt_manager is None:
+                _crt_manager = CRTTransferManager(
+                    crt_client=create_s3_crt_client(region=_resolve_region())
+                )
+    return _crt_manager
+
+
+def _make_video_key(original_filename: str, user_id: int) -> str:
+    """Mint the S3 key for a new video: {user_id}/{uuid}{ext}."""
+    ext = os.path.splitext(original_filename)[1].lower() or ".mp4"
+    return f"{user_id}/{uuid4().hex}{ext}"
+
+
+def _guess_content_type(filename: str) -> str:
+    """MIME type from the LUT for the common video formats, falling back
+    to guess_type for anything unusual, then to binary."""
+    ext = os.path.splitext(filename)[1].lower() or ".mp4"
+    return _EXT_TO_MIME.get(ext) or (
+        mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    )
 
 
 def upload_video_to_s3(
-    file_obj: BinaryIO,
+    file_obj: BinaryIO | Path | str,
     original_filename: str,
     user_id: int,
+    *,
+    content_length: Optional[int] = None,
+    key: Optional[str] = None,
 ) -> str:
     """
-    Upload a file-like object to S3 under {user_id}/{uuid}{ext}
-    and return the S3 key to store in your DB.
-    """
-    # Get extension from filename (.mp4, .mov, etc.). Default to .mp4 if none.
-    ext = Path(original_filename).suffix or ".mp4"
+    Upload a file-like object (or a path to a local file) to S3 under
+    {user_id}/{uuid}{ext} and return the S3 key to store in your DB.
 
-    # Guess MIME type, fallback to binary
-    content_type, _ = mimetypes.guess_type(original_filename)
-    if content_type is None:
-        content_type = "application/octet-stream"
+    File-like bodies stream as-is — API uploads never hit a temp file
+    here. Paths are opened once with their size taken from stat.
 
-    # Generate a unique video id
-    video_id = uuid4().hex
+    When the size is known (passed in, stat'ed, or measured with a cheap
+    seek on seekable files) and fits under the multipart threshold, the
+    upload is a single PUT with an explicit Content-Length, skipping
+    s3transfer's part-sizing buffer pass entirely.
+    """
+    if isinstance(file_obj, (Path, str)):
+        path = Path(file_obj)
+        name = original_filename or path.name
+        size = path.stat().st_size
+        if key is None:
+            key = _make_video_key(name, user_id)
+
+        # Large on-disk files take the CRT manager when awscrt is
+        # installed: native multipart, no Python worker threads.
+        crt = _get_crt_manager()
+        if crt is not None and size >= _TRANSFER_CONFIG.multipart_threshold:
+            crt.upload(
+                str(path),
+                BUCKET_NAME,
+                key,
+                extra_args={"ContentType": _guess_content_type(name)},
+            ).result()
+            return key
+
+        with path.open("rb") as f:
+            return upload_video_to_s3(
+                f, name, user_id, content_length=size, key=key
+            )
+
+    content_type = _guess_content_type(original_filename)
 
-    # This is the S3 key (path inside the bucket)
-    key = f"{user_id}/{video_id}{ext}"
+    # This is the S3 key (path inside the bucket); callers that need the
+    # key before the upload finishes can generate it up front and pass it in
+    if key is None:
+        key = _make_video_key(original_filename, user_id)
 
     # Make sure we're at the start of the file
     file_obj.seek(0)
 
-    # Upload the file object
-    s3.upload_fileobj(
-        Fileobj=file_obj,
-        Bucket=BUCKET_NAME,
-        Key=key,
-        ExtraArgs={"ContentType": content_type},
-    )
+    if content_length is None and file_obj.seekable():
+        content_length = file_obj.seek(0, 2)
+        file_obj.seek(0)
+
+    def _put() -> None:
+        if content_length is not None and content_length < _TRANSFER_CONFIG.multipart_threshold:
+            # Small enough for one request: no multipart bookkeeping, no
+            # chunk buffering, and S3 gets the exact length up front.
+            get_s3_client().put_object(
+                Bucket=BUCKET_NAME,
+                Key=key,
+                Body=file_obj,
+                ContentType=content_type,
+                ContentLength=content_length,
+            )
+        else:
+            # Multipart for large/unsized bodies
+            get_s3_client().upload_fileobj(
+                Fileobj=file_obj,
+                Bucket=BUCKET_NAME,
+                Key=key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_TRANSFER_CONFIG,
+            )
+
+    # A transient S3 hiccup shouldn't abort a whole collection upload:
+    # retry twice with exponential backoff before giving up.
+    for attempt in range(3):
+        try:
+            _put()
+            break
+        except (ClientError, BotoConnectionError):
+            if attempt == 2 or not file_obj.seekable():
+                raise
+            time.sleep(2 ** attempt)
+            file_obj.seek(0)
 
     return key
 
 
+def upload_videos_to_s3_parallel(
+    paths: Iterable[Path | str],
+    user_id: int,
+    max_workers: int = 8,
+) -> List[str]:
+    """
+    Upload several local video files to S3 concurrently.
+
+    Each upload is independent network I/O, so running them on a thread
+    pool overlaps the transfers instead of paying them back to back.
+    Returns the S3 keys in the same order as `paths`.
+    """
+    paths = [Path(p) for p in paths]
+
+    def _upload(path: Path) -> str:
+        return upload_video_to_s3(path, path.name, user_id)
+
+    if len(paths) <= 1:
+        return [_upload(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_upload, paths))
+
+
+# UNNEST over parallel arrays keeps the inserted row order (and therefore
+# the RETURNING id order) tied to the input via ORDINALITY, which a plain
+# multi-row VALUES list doesn't strictly guarantee. The statement is
+# PREPAREd once per pooled connection so repeated batches skip the
+# parse/plan step and only ship parameters.
+_PREPARE_INSERT_VIDEOS_SQL = """
+    PREPARE ins_videos (int[], text[], text[], text[], int[]) AS
+    INSERT INTO videos (user_id, s3_key, video_title, video_description, collection_id)
+    SELECT t.user_id, t.s3_key, t.video_title, t.video_description, t.collection_id
+    FROM UNNEST($1, $2, $3, $4, $5)
+        WITH ORDINALITY AS t(user_id, s3_key, video_title, video_description, collection_id, ord)
+    ORDER BY t.ord
+    RETURNING id;
+"""
+
+_EXECUTE_INSERT_VIDEOS_SQL = "EXECUTE ins_videos (%s, %s, %s, %s, %s)"
+
+
+def _insert_video_rows(cur, rows: List[tuple]) -> List[int]:
+    """Insert (user_id, s3_key, title, description, collection_id) rows
+    in one statement, returning ids in input order."""
+    # Prepared statements are per-session; the flag rides on the pooled
+    # connection so each one pays the PREPARE exactly once.
+    conn = cur.connection
+    try:
+        if not getattr(conn, "_ins_videos_prepared", False):
+            try:
+                cur.execute(_PREPARE_INSERT_VIDEOS_SQL)
+            except psycopg2.errors.DuplicatePreparedStatement:
+                # A PREPARE committed by an earlier batch survives later
+                # rollbacks (rollback only undoes a PREPARE from the
+                # aborted transaction itself), so the cleared flag can
+                # be stale. The statement is still usable — just clear
+                # the transaction this failed PREPARE aborted.
+                conn.rollback()
+            conn._ins_videos_prepared = True
+        columns = list(zip(*rows))
+        cur.execute(_EXECUTE_INSERT_VIDEOS_SQL, [list(col) for col in columns])
+        return [int(r[0]) for r in cur.fetchall()]
+    except psycopg2.Error:
+        # A failed transaction rolls the PREPARE back with it; forget the
+        # flag so the next batch on this connection re-prepares.
+        conn._ins_videos_prepared = False
+        raise
+
+
+def add_videos_bulk(rows: List[tuple]) -> List[int]:
+    """
+    Insert many video rows in a single multi-row INSERT.
+
+    Each row is (user_id, s3_key, title, description, collection_id).
+    One statement and one commit instead of a round trip per video, which
+    is what the collection pipelines want after rendering n subtopics.
+
+    Returns the new video ids (same order as the inserted rows).
+    """
+    if not rows:
+        return []
+
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            ids = _insert_video_rows(cur, rows)
+        conn.commit()
+
+    return ids
+
+
+def add_videos_pipelined(
+    items: List[Dict[str, Any]],
+    user_id: int,
+    max_workers: int = 8,
+) -> List[int]:
+    """
+    Upload a batch of videos and insert their rows with the two stages
+    overlapped.
+
+    Each item is {"path", "title", "description", "collection_id"}.
+    Uploads run on a thread pool while the calling thread plays DB writer:
+    as each upload finishes it flushes small multi-row insert batches on one
+    connection, so the batch costs roughly max(upload time, insert time)
+    instead of their sum. A single commit covers all rows.
+
+    Returns the new video ids in the same order as `items`.
+    """
+    if not items:
+        return []
+
+    flush_batch = 8
+    ids_by_index: Dict[int, int] = {}
+
+    def _upload(item: Dict[str, Any]) -> str:
+        path = Path(item["path"])
+        return upload_video_to_s3(path, path.name, user_id)
+
+    with db_conn() as conn:
+        with conn.cursor() as cur, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_upload, item): index
+                for index, item in enumerate(items)
+            }
+
+            pending: List[tuple] = []  # (index, row)
+
+            def _flush() -> None:
+                if not pending:
+                    return
+                rows = [row for _, row in pending]
+                for (index, _), row_id in zip(pending, _insert_video_rows(cur, rows)):
+                    ids_by_index[index] = row_id
+                pending.clear()
+
+            for future in as_completed(futures):
+                index = futures[future]
+                item = items[index]
+                pending.append(
+                    (
+                        index,
+                        (
+                            user_id,
+                            future.result(),
+                            item.get("title"),
+                            item.get("description"),
+                            item.get("collection_id"),
+                        ),
+                    )
+                )
+                if len(pending) >= flush_batch:
+                    _flush()
+
+            _flush()
+        conn.commit()
+
+    return [ids_by_index[index] for index in range(len(items))]
+
+
+# Small shared pool for the speculative row insert in add_video; the
+# insert is milliseconds, so a few workers cover concurrent requests.
+_INSERT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="video-insert")
+
+
+def _delete_video_row(video_id: int) -> None:
+    """Remove a speculatively inserted row after its upload failed."""
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM videos WHERE id = %s", (video_id,))
+        conn.commit()
+
+
 def add_video(
     user_id: int,
     file_obj: BinaryIO,
@@ -66,7 +521,7 @@ def add_video(
     - uploads file object to S3
     - inserts row into videos table
     Returns the new video id.
-    
+
     Args:
         user_id: User who owns the video
         file_obj: File-like object containing video data
@@ -75,28 +530,52 @@ def add_video(
         description: Video description
         collection_id: Optional collection ID to group this video with others
     """
-    s3_key = upload_video_to_s3(file_obj, original_filename, user_id)
-
-    conn = get_db_conn()
-    conn.autocommit = True
+    # The key is deterministic once minted, so the row insert doesn't
+    # need to wait for the upload: run both concurrently and the call
+    # costs max(upload, insert) instead of their sum. If the upload
+    # fails, the speculatively inserted row is deleted again.
+    s3_key = _make_video_key(original_filename, user_id)
+    insert_future = _INSERT_POOL.submit(
+        add_videos_bulk, [(user_id, s3_key, title, description, collection_id)]
+    )
     try:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO videos (user_id, s3_key, video_title, video_description, collection_id)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id;
-                """,
-                (user_id, s3_key, title, description, collection_id),
-            )
-            row = cur.fetchone()
-            if row is None:
-                raise RuntimeError("INSERT INTO videos RETURNING id returned no row")
-            video_id = row[0]
-    finally:
-        conn.close()
+        upload_video_to_s3(file_obj, original_filename, user_id, key=s3_key)
+    except Exception:
+        try:
+            (video_id,) = insert_future.result()
+        except Exception:
+            pass  # insert failed too; nothing to roll back
+        else:
+            _delete_video_row(video_id)
+        raise
+
+    (video_id,) = insert_future.result()
+    return video_id
 
-    return int(video_id)
+
+async def add_video_async(
+    user_id: int,
+    file_obj: BinaryIO,
+    original_filename: str,
+    title: str | None = None,
+    description: str | None = None,
+    collection_id: Optional[int] = None,
+) -> int:
+    """
+    Event-loop-friendly add_video: the blocking upload + insert run on a
+    worker thread (the same offloading pattern the API handlers use), so
+    an async endpoint can await it without pinning the loop for the
+    seconds a video upload takes.
+    """
+    return await asyncio.to_thread(
+        add_video,
+        user_id,
+        file_obj,
+        original_filename,
+        title,
+        description,
+        collection_id,
+    )
 
 
 def get_video(user_id: int, video_id: int) -> Dict[str, Any]:
@@ -107,9 +586,22 @@ def get_video(user_id: int, video_id: int) -> Dict[str, Any]:
     Returns a dict with DB fields + 'presigned_url'.
     Raises ValueError if not found.
     """
-    conn = get_db_conn()
-    try:
-        with conn.cursor() as cur:
+    # Copy the memoized row so callers can't mutate the cached entry
+    video = dict(_get_video_row(user_id, video_id))
+    video["presigned_url"] = _presign(video["s3_key"])
+    return video
+
+
+@lru_cache(maxsize=4096)
+def _get_video_row(user_id: int, video_id: int) -> Dict[str, Any]:
+    """
+    Memoized (user_id, video_id) -> row lookup. Video rows are
+    write-once in this schema, so a hit skips the DB round trip
+    entirely; not-found raises, which lru_cache doesn't cache, so a
+    video added later is still found.
+    """
+    with db_conn() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
                 """
                 SELECT id, user_id, s3_key, video_title, video_description, collection_id, created_at
@@ -119,30 +611,11 @@ def get_video(user_id: int, video_id: int) -> Dict[str, Any]:
                 (video_id, user_id),
             )
             row = cur.fetchone()
-    finally:
-        conn.close()
 
     if row is None:
         raise ValueError("Video not found for given user_id and video_id")
 
-    vid_id, user_id_db, s3_key, title, desc, coll_id, created_at = row
-
-    presigned_url = s3.generate_presigned_url(
-        "get_object",
-        Params={"Bucket": BUCKET_NAME, "Key": s3_key},
-        ExpiresIn=3600,  # 1 hour
-    )
-
-    return {
-        "id": vid_id,
-        "user_id": user_id_db,
-        "s3_key": s3_key,
-        "video_title": title,
-        "video_description": desc,
-        "collection_id": coll_id,
-        "created_at": created_at,
-        "presigned_url": presigned_url,
-    }
+    return dict(row)
 
 
 def get_user_videos(
@@ -156,12 +629,13 @@ def get_user_videos(
 
     Ordered by newest first (created_at DESC, id DESC).
     """
-    conn = get_db_conn()
-    try:
-        with conn.cursor() as cur:
+    with db_conn() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # Listing cards don't show the (potentially long) description,
+            # so don't ship it from Postgres; get_video has the full row.
             cur.execute(
                 """
-                SELECT id, s3_key, video_title, video_description, collection_id, created_at
+                SELECT id, s3_key, video_title AS title, collection_id, created_at
                 FROM videos
                 WHERE user_id = %s
                 ORDER BY created_at DESC, id DESC
@@ -171,46 +645,40 @@ def get_user_videos(
                 (user_id, offset, limit),
             )
             rows = cur.fetchall()
-    finally:
-        conn.close()
+
+    presigned_urls = _presign_many(row["s3_key"] for row in rows)
 
     videos: List[Dict[str, Any]] = []
-    for vid_id, s3_key, title, desc, coll_id, created_at in rows:
-        presigned_url = s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": BUCKET_NAME, "Key": s3_key},
-            ExpiresIn=3600,  # 1 hour
-        )
-        videos.append(
-            {
-                "id": vid_id,
-                "title": title,
-                "description": desc,
-                "collection_id": coll_id,
-                "created_at": created_at,
-                "presigned_url": presigned_url,
-            }
-        )
+    for row, presigned_url in zip(rows, presigned_urls):
+        video = dict(row)
+        del video["s3_key"]
+        video["presigned_url"] = presigned_url
+        videos.append(video)
 
     return videos
 
 
+# Compiled once; these run per row in the listing sort's key function
+_SUBTOPIC_DESC_RE = re.compile(r'Subtopic\s*(\d+)/\d+', re.IGNORECASE)
+_SUBTOPIC_TITLE_RE = re.compile(r'subtopic[_\s]?(\d+)', re.IGNORECASE)
+
+
 def _extract_subtopic_number_from_video(video: Dict[str, Any]) -> int:
     """Extract subtopic number from video description, otherwise return a high number."""
     # Check description first for "Subtopic X/Y" pattern
     description = video.get('description', '')
     if description:
-        match = re.search(r'Subtopic\s*(\d+)/\d+', description, re.IGNORECASE)
+        match = _SUBTOPIC_DESC_RE.search(description)
         if match:
             return int(match.group(1))
-    
+
     # Check title for patterns like "subtopic_1", "subtopic 1", or numbers
     title = video.get('title', '')
     if title:
-        match = re.search(r'subtopic[_\s]?(\d+)', title, re.IGNORECASE)
+        match = _SUBTOPIC_TITLE_RE.search(title)
         if match:
             return int(match.group(1))
-    
+
     # If no explicit subtopic, return a high number to sort to the end
     return 999999
 
@@ -221,54 +689,84 @@ def get_collection_videos(
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
     """
-    Get all videos in a collection.
-    
-    Returns:
-        List of video dicts with presigned URLs, ordered by subtopic number (1→n)
+    Get videos in a collection, ordered by subtopic number (1→n).
+
+    Ordering and pagination run in SQL against the stored subtopic_number
+    generated column (see init.sql), so only the requested page crosses
+    the wire and gets presigned. Falls back to the old fetch-all +
+    Python-sort path while the column migration hasn't been applied.
     """
-    conn = get_db_conn()
     try:
-        with conn.cursor() as cur:
+        with db_conn() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT id, user_id, s3_key, video_title AS title, video_description AS description, collection_id, created_at
+                    FROM videos
+                    WHERE collection_id = %s
+                    ORDER BY subtopic_number ASC NULLS LAST, created_at ASC, id ASC
+                    OFFSET %s
+                    LIMIT %s;
+                    """,
+                    (collection_id, offset, limit if limit and limit > 0 else None),
+                )
+                rows = cur.fetchall()
+    except psycopg2.errors.UndefinedColumn:
+        return _get_collection_videos_python_sort(collection_id, offset, limit)
+
+    return _rows_to_collection_videos(rows)
+
+
+def _rows_to_collection_videos(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Presign a page of collection rows (as a batch) and attach the URLs."""
+    rows = list(rows)
+    presigned_urls = _presign_many(row["s3_key"] for row in rows)
+
+    videos: List[Dict[str, Any]] = []
+    for row, presigned_url in zip(rows, presigned_urls):
+        video = dict(row)
+        del video["s3_key"]
+        video["presigned_url"] = presigned_url
+        videos.append(video)
+    return videos
+
+
+def _get_collection_videos_python_sort(
+    collection_id: int,
+    offset: int = 0,
+    limit: int = 50,
+) -> List[Dict[str, Any]]:
+    """
+    Pre-migration fallback: fetch the whole collection and sort by the
+    regex-extracted subtopic number in Python. URLs are only signed for
+    the rows that survive pagination.
+    """
+    with db_conn() as conn:
+        # Named (server-side) cursor: big collections stream in itersize
+        # batches straight into the top-K heap instead of materializing
+        # every row in Python first.
+        with conn.cursor(name="collection_videos_cur", cursor_factory=RealDictCursor) as cur:
+            cur.itersize = 200
             cur.execute(
                 """
-                SELECT id, user_id, s3_key, video_title, video_description, collection_id, created_at
+                SELECT id, user_id, s3_key, video_title AS title, video_description AS description, collection_id, created_at
                 FROM videos
                 WHERE collection_id = %s
                 ORDER BY created_at ASC, id ASC;
                 """,
                 (collection_id,),
             )
-            rows = cur.fetchall()
-    finally:
-        conn.close()
-
-    # Build video list with presigned URLs
-    all_videos: List[Dict[str, Any]] = []
-    for vid_id, user_id, s3_key, title, desc, coll_id, created_at in rows:
-        presigned_url = s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": BUCKET_NAME, "Key": s3_key},
-            ExpiresIn=3600,
-        )
-        all_videos.append(
-            {
-                "id": vid_id,
-                "user_id": user_id,
-                "title": title,
-                "description": desc,
-                "collection_id": coll_id,
-                "created_at": created_at,
-                "presigned_url": presigned_url,
-            }
-        )
-    
-    # Sort by subtopic number (1→n)
-    sorted_videos = sorted(all_videos, key=_extract_subtopic_number_from_video)
-    
-    # Apply pagination after sorting
-    if limit and limit > 0:
-        paginated_videos = sorted_videos[offset:offset + limit]
-    else:
-        paginated_videos = sorted_videos[offset:]
-
-    return paginated_videos
+
+            # Pagination only needs the first offset+limit rows, so take
+            # the top-K with a heap (O(N log K)) instead of fully sorting
+            # N rows. nsmallest matches sorted()[:k] exactly, ties included.
+            # Rows already carry title/description keys, so the regex
+            # extractor doubles as the sort key.
+            if limit and limit > 0:
+                page = heapq.nsmallest(
+                    offset + limit, cur, key=_extract_subtopic_number_from_video
+                )[offset:]
+            else:
+                page = sorted(cur, key=_extract_subtopic_number_from_video)[offset:]
+
+    return _rows_to_collection_videos(page)
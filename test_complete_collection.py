@@ -1,55 +1,65 @@
 #!/usr/bin/env python3
 """
 Test the complete collection pipeline (subtopics + quiz) using a text file.
+
+Runs the real pipeline end to end; under pytest it skips itself when the
+source text or background videos aren't present.
 """
 import sys
 import os
 from pathlib import Path
 
+import pytest
+
 # Set UTF-8 encoding for Windows
 if sys.platform == "win32":
     os.environ["PYTHONIOENCODING"] = "utf-8"
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-from backend_pipeline.generate_complete_collection import generate_complete_collection
+_SOURCE = Path("test_photosynthesis.txt")
+_BACKGROUND_VIDEOS = Path("assets/videos")
 
-def main():
-    # Test with photosynthesis text
-    source = str(Path("test_photosynthesis.txt"))
-    source_type = "text"
-    background_video = Path("assets/videos")
-    output_dir = Path("assets/output")
-    audio_dir = Path("assets/audio/generated")
-    user_id = 1
-    
+
+@pytest.mark.skipif(
+    not (_SOURCE.exists() and _BACKGROUND_VIDEOS.exists()),
+    reason=f"live pipeline smoke test; needs {_SOURCE} and {_BACKGROUND_VIDEOS}",
+)
+def test_complete_collection(collection_generator):
     print("=" * 60)
     print("Testing Complete Collection Pipeline")
     print("=" * 60)
-    print(f"Source: {source}")
-    print(f"Type: {source_type}")
+    print(f"Source: {_SOURCE}")
+    print("Type: text")
     print("=" * 60 + "\n")
-    
+
+    result = collection_generator(
+        source=str(_SOURCE),
+        source_type="text",
+        background_video=_BACKGROUND_VIDEOS,
+        output_dir=Path("assets/output"),
+        audio_dir=Path("assets/audio/generated"),
+        user_id=1,
+    )
+
+    assert result["total_videos"] == result["subtopic_count"] + result["quiz_count"]
+
+    print("\n" + "=" * 60)
+    print("✅ TEST PASSED!")
+    print("=" * 60)
+    print(f"Collection ID: {result['collection_id']}")
+    print(f"Collection Title: {result['collection_title']}")
+    print(f"Total Videos: {result['total_videos']}")
+    print(f"  - Subtopics: {result['subtopic_count']}")
+    print(f"  - Quiz: {result['quiz_count']}")
+    print("=" * 60)
+
+
+def main():
+    from backend_pipeline.generate_complete_collection import generate_complete_collection
+
     try:
-        result = generate_complete_collection(
-            source=source,
-            source_type=source_type,
-            background_video=background_video,
-            output_dir=output_dir,
-            audio_dir=audio_dir,
-            user_id=user_id,
-        )
-        
-        print("\n" + "=" * 60)
-        print("✅ TEST PASSED!")
-        print("=" * 60)
-        print(f"Collection ID: {result['collection_id']}")
-        print(f"Collection Title: {result['collection_title']}")
-        print(f"Total Videos: {result['total_videos']}")
-        print(f"  - Subtopics: {result['subtopic_count']}")
-        print(f"  - Quiz: {result['quiz_count']}")
-        print("=" * 60)
-        
+        test_complete_collection(generate_complete_collection)
     except Exception as e:
         print("\n" + "=" * 60)
         print("❌ TEST FAILED!")
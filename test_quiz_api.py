@@ -6,10 +6,19 @@ This script demonstrates testing the quiz pipeline through the API endpoints.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from pathlib import Path
 
+# One keep-alive session for the whole script: repeated posts reuse the
+# pooled TCP connection instead of paying a fresh handshake per call,
+# which matters when this doubles as a load-style smoke test.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 def test_quiz_extraction_api(file_path: str, file_type: str, base_url: str = "http://localhost:8000"):
     """
@@ -30,13 +39,14 @@ def test_quiz_extraction_api(file_path: str, file_type: str, base_url: str = "ht
         # For YouTube, send as form data with URL
         data = {"file_type": file_type}
         files = {"file": (None, file_path)}
+        response = _session.post(url, files=files, data=data)
     else:
         # For files, upload the actual file
         with open(file_path, "rb") as f:
             files = {"file": (Path(file_path).name, f, "application/octet-stream")}
             data = {"file_type": file_type}
-            
-            response = requests.post(url, files=files, data=data)
+
+            response = _session.post(url, files=files, data=data)
     
     if response.status_code == 200:
         quiz_data = response.json()
@@ -74,7 +84,7 @@ def test_quiz_video_generation_api(quiz_modules: list, user_id: int = 1, base_ur
         "quiz_modules": quiz_modules
     }
     
-    response = requests.post(url, json=payload)
+    response = _session.post(url, json=payload)
     
     if response.status_code == 200:
         result = response.json()
@@ -1,28 +1,52 @@
-import sys
-import os
-sys.path.insert(0, '.')
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+"""Smoke test for quiz video timing with fresh audio generation.
+
+Runs the real quiz pipeline, so it needs the local assets and live
+credentials; under pytest it skips itself when the quiz transcript JSON
+isn't present. Watch the output for "Warning: Calculated duration
+differs" — no warning means timing is correct.
+"""
 
-from backend_pipeline.generate_quiz_video import generate_quiz_video_from_file
+import os
 from pathlib import Path
 
-print("Testing quiz video timing with fresh audio generation...")
-print("=" * 60)
+import pytest
+
+os.environ["PYTHONIOENCODING"] = "utf-8"
+
+_QUIZ_JSON = Path("assets/test_output/quiz_transcripts.json")
+
 
-result = generate_quiz_video_from_file(
-    quiz_path=Path("assets/test_output/quiz_transcripts.json"),
-    background_video=Path("assets/videos"),
-    output_dir=Path("assets/output/quiz"),
-    audio_dir=Path("assets/audio/quiz"),
-    user_id=1,
+@pytest.mark.skipif(
+    not _QUIZ_JSON.exists(),
+    reason=f"live pipeline smoke test; needs {_QUIZ_JSON}",
 )
+def test_timing_fix(quiz_generator):
+    print("Testing quiz video timing with fresh audio generation...")
+    print("=" * 60)
+
+    result = quiz_generator(
+        quiz_path=_QUIZ_JSON,
+        background_video=Path("assets/videos"),
+        output_dir=Path("assets/output/quiz"),
+        audio_dir=Path("assets/audio/quiz"),
+        user_id=1,
+    )
+
+    assert result["video_id"]
+    assert result["s3_key"]
+
+    print("\n" + "=" * 60)
+    print("SUCCESS!")
+    print("=" * 60)
+    print(f"Video ID: {result['video_id']}")
+    print(f"S3 Key: {result['s3_key']}")
+    print(f"Title: {result['video_title']}")
+    print("\nCheck the output above for timing warnings.")
+    print("If you see 'Warning: Calculated duration differs', timing is still off.")
+    print("If no warning appears, timing is correct!")
+
+
+if __name__ == "__main__":
+    from backend_pipeline.generate_quiz_video import generate_quiz_video_from_file
 
-print("\n" + "=" * 60)
-print("SUCCESS!")
-print("=" * 60)
-print(f"Video ID: {result['video_id']}")
-print(f"S3 Key: {result['s3_key']}")
-print(f"Title: {result['video_title']}")
-print("\nCheck the output above for timing warnings.")
-print("If you see 'Warning: Calculated duration differs', timing is still off.")
-print("If no warning appears, timing is correct!")
+    test_timing_fix(generate_quiz_video_from_file)